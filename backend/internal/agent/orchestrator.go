@@ -402,6 +402,9 @@ func (o *Orchestrator) runTurnRecursiveWithImage(ctx context.Context, execCtx *t
 	return turnResult, nil
 }
 
+// sentenceEndPattern matches a sentence terminator followed by whitespace.
+var sentenceEndPattern = regexp.MustCompile(`[.!?]\s+`)
+
 // smartChunkContent intelligently splits content into chunks at natural boundaries
 // It tries to split at paragraph breaks first, then sentence breaks, avoiding mid-word splits
 func smartChunkContent(content string, maxChunkSize int) []string {
@@ -431,8 +434,7 @@ func smartChunkContent(content string, maxChunkSize int) []string {
 		}
 		
 		// Try to split at sentence boundaries (period, exclamation, question mark followed by space)
-		sentenceEnd := regexp.MustCompile(`[.!?]\s+`)
-		matches := sentenceEnd.FindAllStringIndex(chunk, -1)
+		matches := sentenceEndPattern.FindAllStringIndex(chunk, -1)
 		if len(matches) > 0 {
 			// Use the last sentence boundary that's in the last quarter of the chunk
 			for i := len(matches) - 1; i >= 0; i-- {
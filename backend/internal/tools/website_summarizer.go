@@ -240,6 +240,9 @@ func (e *Executor) combineChunkSummaries(ctx context.Context, chunkSummaries []s
 	return strings.TrimSpace(response.Content), nil
 }
 
+// sentenceEndPattern matches a sentence terminator followed by whitespace.
+var sentenceEndPattern = regexp.MustCompile(`[.!?]\s+`)
+
 // smartChunkContent intelligently splits content into chunks at natural boundaries
 // It tries to split at paragraph breaks first, then sentence breaks, avoiding mid-word splits
 func smartChunkContent(content string, maxChunkSize int) []string {
@@ -269,8 +272,7 @@ func smartChunkContent(content string, maxChunkSize int) []string {
 		}
 		
 		// Try to split at sentence boundaries (period, exclamation, question mark followed by space)
-		sentenceEnd := regexp.MustCompile(`[.!?]\s+`)
-		matches := sentenceEnd.FindAllStringIndex(chunk, -1)
+		matches := sentenceEndPattern.FindAllStringIndex(chunk, -1)
 		if len(matches) > 0 {
 			// Use the last sentence boundary that's in the last quarter of the chunk
 			for i := len(matches) - 1; i >= 0; i-- {